@@ -1,17 +1,34 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, ClassVar
 
 
 class LineAPIError(Exception):
-    pass
+    __slots__ = ()
+
+    status_code: ClassVar[int | None] = None
+    message: ClassVar[str | None] = None
+
+    def __init_subclass__(cls, *, status_code: int | None = None, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if status_code is not None:
+            cls.status_code = status_code
+            _STATUS_MAP[status_code] = cls
+
+    def __str__(self) -> str:
+        return self.message or super().__str__()
+
+
+_STATUS_MAP: dict[int, type[LineAPIError]] = {}
 
 
 class LineError(Exception):
-    pass
+    __slots__ = ()
 
 
 class CommandExecError(LineError):
+    __slots__ = ("command_name", "e")
+
     def __init__(self, command_name: str, e: Exception) -> None:
         self.command_name = command_name
         self.e = e
@@ -21,6 +38,8 @@ class CommandExecError(LineError):
 
 
 class ParamParseError(LineError):
+    __slots__ = ("command_name", "e")
+
     def __init__(self, command_name: str, e: Exception) -> None:
         self.command_name = command_name
         self.e = e
@@ -30,6 +49,8 @@ class ParamParseError(LineError):
 
 
 class IntConvertError(LineError):
+    __slots__ = ("param_name", "value")
+
     def __init__(self, param_name: str, value: Any) -> None:
         self.param_name = param_name
         self.value = value
@@ -39,6 +60,8 @@ class IntConvertError(LineError):
 
 
 class FloatConvertError(LineError):
+    __slots__ = ("param_name", "value")
+
     def __init__(self, param_name: str, value: Any) -> None:
         self.param_name = param_name
         self.value = value
@@ -48,6 +71,8 @@ class FloatConvertError(LineError):
 
 
 class CogLoadError(LineError):
+    __slots__ = ("cog_path", "e")
+
     def __init__(self, cog_path: Any, e: Exception | str) -> None:
         self.cog_path = cog_path
         self.e = e
@@ -56,39 +81,52 @@ class CogLoadError(LineError):
         return f"An error occurred while loading the cog {self.cog_path}: {self.e}"
 
 
-class BadRequestError(LineAPIError):
-    def __str__(self) -> str:
-        return "400: There was a problem with the request. Check the request parameters and JSON format."
+class BadRequestError(LineAPIError, status_code=400):
+    __slots__ = ()
 
+    message = (
+        "400: There was a problem with the request. Check the request parameters and JSON format."
+    )
 
-class UnauthorizedError(LineAPIError):
-    def __str__(self) -> str:
-        return "401: Check that the authorization header is correct."
 
+class UnauthorizedError(LineAPIError, status_code=401):
+    __slots__ = ()
 
-class ForbiddenError(LineAPIError):
-    def __str__(self) -> str:
-        return "403: You are not authorized to use the API. Confirm that your account or plan is authorized to use the API."
+    message = "401: Check that the authorization header is correct."
 
 
-class PayloadTooLargeError(LineAPIError):
-    def __str__(self) -> str:
-        return "413: Request exceeds the max size of 2MB. Make the request smaller than 2MB and try again."
+class ForbiddenError(LineAPIError, status_code=403):
+    __slots__ = ()
 
+    message = "403: You are not authorized to use the API. Confirm that your account or plan is authorized to use the API."
 
-class TooManyRequestsError(LineAPIError):
-    def __str__(self) -> str:
-        return "429: Temporarily restricting requests because rate-limit has been exceeded by a large number of requests."
 
+class PayloadTooLargeError(LineAPIError, status_code=413):
+    __slots__ = ()
 
-class InternalServerError(LineAPIError):
-    def __str__(self) -> str:
-        return "500: There was a temporary error on the API server."
+    message = (
+        "413: Request exceeds the max size of 2MB. Make the request smaller than 2MB and try again."
+    )
+
+
+class TooManyRequestsError(LineAPIError, status_code=429):
+    __slots__ = ()
+
+    message = "429: Temporarily restricting requests because rate-limit has been exceeded by a large number of requests."
+
+
+class InternalServerError(LineAPIError, status_code=500):
+    __slots__ = ()
+
+    message = "500: There was a temporary error on the API server."
 
 
 def raise_for_status(status_code: int) -> None:
     """Raises an exception if the status code of the response is not 200.
 
+    The exception class is looked up in ``_STATUS_MAP``, which each ``LineAPIError`` subclass
+    registers itself in with its ``status_code``.
+
     Args:
         status_code (int): The status code of the response.
 
@@ -99,16 +137,10 @@ def raise_for_status(status_code: int) -> None:
         PayloadTooLargeError: If the status code is 413.
         TooManyRequestsError: If the status code is 429.
         InternalServerError: If the status code is 500.
-    """
-    if status_code == 400:
-        raise BadRequestError
-    if status_code == 401:
-        raise UnauthorizedError
-    if status_code == 403:
-        raise ForbiddenError
-    if status_code == 413:
-        raise PayloadTooLargeError
-    if status_code == 429:
-        raise TooManyRequestsError
-    if status_code == 500:
-        raise InternalServerError
+    """  # ruff: ignore[docstring-extraneous-exception]
+    if status_code == 200:
+        return
+
+    exc = _STATUS_MAP.get(status_code)
+    if exc is not None:
+        raise exc
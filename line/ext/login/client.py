@@ -1,26 +1,36 @@
 from __future__ import annotations
 
-from typing import Literal
+import json
+from typing import Literal, get_args
 
 import aiohttp
 
 from ...exceptions import raise_for_status
 from .response import UserProfile
 
+_TOKEN_URL = "https://api.line.me/oauth2/v2.1/token"
+
+Scope = Literal[
+    "profile", "profile%20openid", "profile%20openid%20email", "openid", "openid%20email"
+]
+_SCOPES = frozenset(get_args(Scope))
+
 
 class LineLoginAPI:
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        *,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
         self.__client_id = client_id
         self.__client_secret = client_secret
         self._redirect_uri = redirect_uri
+        self._session = session
 
-    def get_oauth_uri(
-        self,
-        state: str,
-        scopes: Literal[
-            "profile", "profile%20openid", "profile%20openid%20email", "openid", "openid%20email"
-        ],
-    ) -> str:
+    def get_oauth_uri(self, state: str, scopes: Scope) -> str:
         """Returns the OAuth URI for LINE Login.
 
         Args:
@@ -29,7 +39,14 @@ class LineLoginAPI:
 
         Returns:
             str: The OAuth URI for LINE Login.
+
+        Raises:
+            ValueError: If the scopes are not one of the supported values.
         """
+        if scopes not in _SCOPES:
+            msg = f"Invalid scopes: {scopes}"
+            raise ValueError(msg)
+
         base_uri = "https://access.line.me/oauth2/v2.1/authorize"
         return f"{base_uri}?response_type=code&client_id={self.__client_id}&redirect_uri={self._redirect_uri}&state={state}&scope={scopes}"
 
@@ -49,13 +66,16 @@ class LineLoginAPI:
             "client_id": self.__client_id,
             "client_secret": self.__client_secret,
         }
+        if self._session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._request_access_token(session, data)
+        return await self._request_access_token(self._session, data)
 
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post("https://api.line.me/oauth2/v2.1/token", data=data) as resp,
-        ):
+    @staticmethod
+    async def _request_access_token(session: aiohttp.ClientSession, data: dict[str, str]) -> str:
+        async with session.post(_TOKEN_URL, data=data) as resp:
             raise_for_status(resp.status)
-            return (await resp.json())["access_token"]
+            return json.loads(await resp.read())["access_token"]
 
     @staticmethod
     async def verify_access_token_validity(access_token: str) -> bool:
@@ -93,4 +113,4 @@ class LineLoginAPI:
             ) as resp,
         ):
             raise_for_status(resp.status)
-            return UserProfile(**(await resp.json()))
+            return UserProfile.model_validate_json(await resp.read())
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import json
+
 import aiohttp
 
 from ...exceptions import raise_for_status
 
+_TOKEN_URL = "https://notify-bot.line.me/oauth/token"
+
 
 class LineNotifyAPI:
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str) -> None:
+    def __init__(
+        self,
+        client_id: str,
+        client_secret: str,
+        redirect_uri: str,
+        *,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
         self.__client_id = client_id
         self.__client_secret = client_secret
         self._redirect_uri = redirect_uri
+        self._session = session
 
     def get_oauth_uri(self, state: str) -> str:
         """Returns the OAuth URI for the LINE Notify client.
@@ -39,12 +51,16 @@ class LineNotifyAPI:
             "client_id": self.__client_id,
             "client_secret": self.__client_secret,
         }
-        async with (
-            aiohttp.ClientSession() as session,
-            session.post("https://notify-bot.line.me/oauth/token", data=data) as resp,
-        ):
+        if self._session is None:
+            async with aiohttp.ClientSession() as session:
+                return await self._request_access_token(session, data)
+        return await self._request_access_token(self._session, data)
+
+    @staticmethod
+    async def _request_access_token(session: aiohttp.ClientSession, data: dict[str, str]) -> str:
+        async with session.post(_TOKEN_URL, data=data) as resp:
             raise_for_status(resp.status)
-            return (await resp.json())["access_token"]
+            return json.loads(await resp.read())["access_token"]
 
     @staticmethod
     async def notify(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from ..utils import find_indexes
 from .actions import *
 from .emoji import *
 from .messages import *
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+
+class FrozenConfig:
+    """Pydantic config shared by the model wrappers, which are never modified once built."""
+
+    frozen = True
+    validate_assignment = False
+    extra = "ignore"
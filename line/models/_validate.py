@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sized
+
+    from pydantic.v1 import BaseModel
+
+
+def check_lengths(*fields: tuple[str, Sized | None, int]) -> None:
+    """Check that each field is within its length limit.
+
+    Args:
+        fields: Tuples of the field name sent to LINE, its value and its maximum length.
+            Fields whose value is None are skipped.
+
+    Raises:
+        ValueError: If a field exceeds its maximum length.
+    """
+    for name, value, limit in fields:
+        if value is not None and len(value) > limit:
+            msg = f"{name} must be less than or equal to {limit} characters"
+            raise ValueError(msg)
+
+
+def check_types(*fields: tuple[str, object, type | tuple[type, ...]]) -> None:
+    """Check that each field has a type the LINE SDK model accepts.
+
+    Args:
+        fields: Tuples of the field name sent to LINE, its value and the accepted type or types.
+            Optional fields must list ``NoneType`` among their accepted types.
+
+    Raises:
+        ValueError: If a field does not have an accepted type.
+    """
+    for name, value, expected in fields:
+        if not isinstance(value, expected):
+            msg = f"{name} has an unsupported type: {type(value).__name__}"
+            raise ValueError(msg)
+
+
+def check_item_types(name: str, values: Iterable[object], expected: type) -> None:
+    """Check that every item of a list field has the type the LINE SDK model accepts.
+
+    Args:
+        name: The field name sent to LINE.
+        values: The items of the field.
+        expected: The accepted item type.
+
+    Raises:
+        ValueError: If an item does not have the accepted type.
+    """
+    for value in values:
+        if not isinstance(value, expected):
+            msg = f"{name} contains an item of unsupported type: {type(value).__name__}"
+            raise ValueError(msg)
+
+
+def init_unvalidated(model: BaseModel, **values: Any) -> None:
+    """Initialize a LINE SDK model without running pydantic validation.
+
+    Meant for constructors that have already checked every argument the SDK model would
+    validate: types, required fields, enum values and length limits. Fields that are not passed
+    are set to their defaults.
+
+    Args:
+        model: The model instance to initialize.
+        values: The field values, keyed by alias or field name.
+    """
+    fields_values: dict[str, Any] = {}
+    fields_set: set[str] = set()
+    for name, field in type(model).__fields__.items():
+        if field.alias in values:
+            fields_values[name] = values[field.alias]
+            fields_set.add(name)
+        elif name in values:
+            fields_values[name] = values[name]
+            fields_set.add(name)
+        elif not field.required:
+            fields_values[name] = field.get_default()
+
+    # BaseModel.__setattr__ rejects names that are not fields, so bypass it like construct() does.
+    object.__setattr__(model, "__dict__", fields_values)  # ruff: ignore[unnecessary-dunder-call]
+    object.__setattr__(model, "__fields_set__", fields_set)  # ruff: ignore[unnecessary-dunder-call]
+    model._init_private_attributes()
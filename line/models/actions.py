@@ -1,13 +1,43 @@
 from __future__ import annotations
 
-from typing import Literal
+from types import NoneType
+from typing import Final, Literal
 
 from linebot.v3 import messaging
 
+from ._config import FrozenConfig
+from ._validate import check_lengths, check_types, init_unvalidated
+
+__all__ = ("MessageAction", "PostbackAction", "RichMenuSwitchAction", "URIAction")
+
+_MAX_DATA: Final[int] = 300
+_MAX_TEXT: Final[int] = 300
+_MAX_URI: Final[int] = 1000
+_MAX_LABEL: Final[int] = 20
+_MAX_RICH_MENU_ALIAS_ID: Final[int] = 32
+
+_INPUT_OPTIONS: Final[frozenset[str | None]] = frozenset(
+    (None, "closeRichMenu", "openRichMenu", "openKeyboard", "openVoice")
+)
+
+_ERR_FILL_IN_TEXT_OPTION = "fillInText can only be specified when inputOption is openKeyboard"
+_ERR_INPUT_OPTION = (
+    "inputOption must be one of closeRichMenu, openRichMenu, openKeyboard or openVoice"
+)
+
+
+class _FrozenAltUri(messaging.AltUri):
+    Config = FrozenConfig
+
+
+_NULL_ALT_URI = _FrozenAltUri(desktop=None)
+
 
 class PostbackAction(messaging.PostbackAction):
     """https://developers.line.biz/en/reference/messaging-api/#postback-action."""
 
+    Config = FrozenConfig
+
     def __init__(
         self,
         label: str,
@@ -18,52 +48,84 @@ class PostbackAction(messaging.PostbackAction):
         | None = None,
         fill_in_text: str | None = None,
     ) -> None:
-        if len(data) > 300:
-            raise ValueError("data must be less than or equal to 300 characters")
-        if len(display_text or "") > 300:
-            raise ValueError("displayText must be less than or equal to 300 characters")
-        if len(fill_in_text or "") > 300:
-            raise ValueError("fillInText must be less than or equal to 300 characters")
-        if fill_in_text and input_option != "openKeyboard":
-            raise ValueError("fillInText can only be specified when inputOption is openKeyboard")
-
-        super().__init__(
-            data=data,
-            label=label,
-            displayText=display_text,
-            inputOption=input_option,
-            fillInText=fill_in_text,
+        check_types(
+            ("label", label, str),
+            ("data", data, str),
+            ("displayText", display_text, (str, NoneType)),
+            ("inputOption", input_option, (str, NoneType)),
+            ("fillInText", fill_in_text, (str, NoneType)),
         )
+        if input_option not in _INPUT_OPTIONS:
+            raise ValueError(_ERR_INPUT_OPTION)
+        if __debug__:
+            check_lengths(
+                ("data", data, _MAX_DATA),
+                ("displayText", display_text, _MAX_TEXT),
+                ("fillInText", fill_in_text, _MAX_TEXT),
+            )
+        if fill_in_text and input_option != "openKeyboard":
+            raise ValueError(_ERR_FILL_IN_TEXT_OPTION)
+
+        values = {"data": data, "label": label}
+        if display_text is not None:
+            values["displayText"] = display_text
+        if input_option is not None:
+            values["inputOption"] = input_option
+        if fill_in_text is not None:
+            values["fillInText"] = fill_in_text
+
+        init_unvalidated(self, **values)
 
 
 class MessageAction(messaging.MessageAction):
     """https://developers.line.biz/en/reference/messaging-api/#message-action."""
 
+    Config = FrozenConfig
+
     def __init__(self, label: str, *, text: str) -> None:
-        if len(text) > 300:
-            raise ValueError("text must be less than or equal to 300 characters")
+        check_types(("label", label, str), ("text", text, str))
+        if __debug__:
+            check_lengths(("text", text, _MAX_TEXT))
 
-        super().__init__(text=text, label=label)
+        init_unvalidated(self, text=text, label=label)
 
 
 class URIAction(messaging.URIAction):
     """https://developers.line.biz/en/reference/messaging-api/#uri-action."""
 
+    Config = FrozenConfig
+
     def __init__(self, label: str, *, uri: str, desktop_alt_uri: str | None = None) -> None:
-        if len(uri) > 1000:
-            raise ValueError("uri must be less than or equal to 1000 characters")
-        if len(desktop_alt_uri or "") > 1000:
-            raise ValueError("desktopAltUri must be less than or equal to 1000 characters")
+        check_types(
+            ("label", label, str),
+            ("uri", uri, str),
+            ("desktopAltUri", desktop_alt_uri, (str, NoneType)),
+        )
+        if __debug__:
+            check_lengths(("uri", uri, _MAX_URI), ("desktopAltUri", desktop_alt_uri, _MAX_URI))
 
-        super().__init__(uri=uri, label=label, altUri=messaging.AltUri(desktop=desktop_alt_uri))
+        alt_uri = (
+            _NULL_ALT_URI if desktop_alt_uri is None else messaging.AltUri(desktop=desktop_alt_uri)
+        )
+        init_unvalidated(self, uri=uri, label=label, altUri=alt_uri)
 
 
 class RichMenuSwitchAction(messaging.RichMenuSwitchAction):
     """https://developers.line.biz/en/reference/messaging-api/#richmenu-switch-action."""
 
+    Config = FrozenConfig
+
     def __init__(self, rich_menu_alias_id: str, *, data: str, label: str | None = None) -> None:
-        if len(label or "") > 20:
-            raise ValueError("label must be less than or equal to 20 characters")
-        if len(data) > 300:
-            raise ValueError("data must be less than or equal to 300 characters")
-        super().__init__(data=data, label=label, richMenuAliasId=rich_menu_alias_id)
+        check_types(
+            ("richMenuAliasId", rich_menu_alias_id, str),
+            ("data", data, str),
+            ("label", label, (str, NoneType)),
+        )
+        if __debug__:
+            check_lengths(
+                ("richMenuAliasId", rich_menu_alias_id, _MAX_RICH_MENU_ALIAS_ID),
+                ("label", label, _MAX_LABEL),
+                ("data", data, _MAX_DATA),
+            )
+
+        init_unvalidated(self, data=data, label=label, richMenuAliasId=rich_menu_alias_id)
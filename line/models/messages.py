@@ -1,20 +1,33 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from types import NoneType
+from typing import TYPE_CHECKING, Final
 
 from linebot.v3 import messaging
 
-from ..utils import find_indexes
+from ..utils import iter_indexes
+from ._config import FrozenConfig
+from ._validate import check_lengths, check_types, init_unvalidated
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from .emoji import Emoji
 
+__all__ = ("ImageMessage", "TemplateMessage", "TextMessage")
+
+_MAX_TEXT: Final[int] = 5000
+_MAX_ALT_TEXT: Final[int] = 400
+_MAX_URL: Final[int] = 2000
+
+_ERR_EMOJI_PLACEHOLDERS = "text has fewer $ placeholders than emojis"
+
 
 class TextMessage(messaging.TextMessage):
     """https://developers.line.biz/en/reference/messaging-api/#text-message."""
 
+    Config = FrozenConfig
+
     def __init__(
         self,
         text: str,
@@ -23,28 +36,37 @@ class TextMessage(messaging.TextMessage):
         emojis: Sequence[Emoji] | None = None,
         quote_token: str | None = None,
     ) -> None:
-        if len(text) > 5000:
-            raise ValueError("text must be less than or equal to 5000 characters")
+        check_types(
+            ("text", text, str),
+            ("quickReply", quick_reply, (messaging.QuickReply, NoneType)),
+            ("quoteToken", quote_token, (str, NoneType)),
+        )
+        if __debug__:
+            check_lengths(("text", text, _MAX_TEXT))
 
-        line_emojis: Sequence[messaging.Emoji] | None = None
+        line_emojis: list[messaging.Emoji] | None = None
         if emojis:
+            emoji_cls = messaging.Emoji
+            indexes = iter_indexes(text, "$")
             line_emojis = []
-            indexes = find_indexes(text, "$")
-            for i, emoji in enumerate(emojis):
+            for emoji in emojis:
+                index = next(indexes, None)
+                if index is None:
+                    raise ValueError(_ERR_EMOJI_PLACEHOLDERS)
                 line_emojis.append(
-                    messaging.Emoji(
-                        index=indexes[i], productId=emoji.product_id, emojiId=emoji.emoji_id
-                    )
+                    emoji_cls(index=index, productId=emoji.product_id, emojiId=emoji.emoji_id)
                 )
 
-        super().__init__(
-            text=text, quickReply=quick_reply, emojis=line_emojis, quoteToken=quote_token
+        init_unvalidated(
+            self, text=text, quickReply=quick_reply, emojis=line_emojis, quoteToken=quote_token
         )
 
 
 class TemplateMessage(messaging.TemplateMessage):
     """https://developers.line.biz/en/reference/messaging-api/#template-messages."""
 
+    Config = FrozenConfig
+
     def __init__(
         self,
         alt_text: str,
@@ -52,15 +74,22 @@ class TemplateMessage(messaging.TemplateMessage):
         template: messaging.Template,
         quick_reply: messaging.QuickReply | None = None,
     ) -> None:
-        if len(alt_text) > 400:
-            raise ValueError("altText must be less than or equal to 400 characters")
+        check_types(
+            ("altText", alt_text, str),
+            ("template", template, messaging.Template),
+            ("quickReply", quick_reply, (messaging.QuickReply, NoneType)),
+        )
+        if __debug__:
+            check_lengths(("altText", alt_text, _MAX_ALT_TEXT))
 
-        super().__init__(altText=alt_text, template=template, quickReply=quick_reply)  # type: ignore
+        init_unvalidated(self, altText=alt_text, template=template, quickReply=quick_reply)
 
 
 class ImageMessage(messaging.ImageMessage):
     """https://developers.line.biz/en/reference/messaging-api/#image-message."""
 
+    Config = FrozenConfig
+
     def __init__(
         self,
         original_content_url: str,
@@ -68,12 +97,19 @@ class ImageMessage(messaging.ImageMessage):
         *,
         quick_reply: messaging.QuickReply | None = None,
     ) -> None:
-        if len(original_content_url) > 2000:
-            raise ValueError("originalContentUrl must be less than or equal to 2000 characters")
-        if len(preview_image_url) > 2000:
-            raise ValueError("previewImageUrl must be less than or equal to 2000 characters")
-
-        super().__init__(
+        check_types(
+            ("originalContentUrl", original_content_url, str),
+            ("previewImageUrl", preview_image_url, str),
+            ("quickReply", quick_reply, (messaging.QuickReply, NoneType)),
+        )
+        if __debug__:
+            check_lengths(
+                ("originalContentUrl", original_content_url, _MAX_URL),
+                ("previewImageUrl", preview_image_url, _MAX_URL),
+            )
+
+        init_unvalidated(
+            self,
             originalContentUrl=original_content_url,
             previewImageUrl=preview_image_url,
             quickReply=quick_reply,
@@ -1,28 +1,46 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from types import NoneType
+from typing import TYPE_CHECKING, Final
 
 from linebot.v3 import messaging
 
+from ._config import FrozenConfig
+from ._validate import check_item_types, check_lengths, check_types, init_unvalidated
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+__all__ = ("QuickReply", "QuickReplyItem")
+
+_MAX_URL: Final[int] = 2000
+_MAX_ITEMS: Final[int] = 13
+
+_ERR_ITEMS = f"The number of items must be less than or equal to {_MAX_ITEMS}"
+
 
 class QuickReplyItem(messaging.QuickReplyItem):
     """https://developers.line.biz/en/reference/messaging-api/#quick-reply-button-object."""
 
+    Config = FrozenConfig
+
     def __init__(self, action: messaging.Action, *, image_url: str | None = None) -> None:
-        if len(image_url or "") > 2000:
-            raise ValueError("imageUrl must be less than or equal to 2000 characters")
+        check_types(("action", action, messaging.Action), ("imageUrl", image_url, (str, NoneType)))
+        if __debug__:
+            check_lengths(("imageUrl", image_url, _MAX_URL))
 
-        super().__init__(action=action, imageUrl=image_url, type="action")
+        init_unvalidated(self, action=action, imageUrl=image_url, type="action")
 
 
 class QuickReply(messaging.QuickReply):
     """https://developers.line.biz/en/reference/messaging-api/#quick-reply."""
 
+    Config = FrozenConfig
+
     def __init__(self, items: Sequence[QuickReplyItem]) -> None:
-        if len(items) > 13:
-            raise ValueError("The number of items must be less than or equal to 13")
+        items = tuple(items)
+        check_item_types("items", items, messaging.QuickReplyItem)
+        if __debug__ and len(items) > _MAX_ITEMS:
+            raise ValueError(_ERR_ITEMS)
 
-        super().__init__(items=items)
+        init_unvalidated(self, items=items)
@@ -1,16 +1,47 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+from types import NoneType
+from typing import TYPE_CHECKING, Final, Literal
 
 from linebot.v3 import messaging
 
+from ._config import FrozenConfig
+from ._validate import check_item_types, check_lengths, check_types, init_unvalidated
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+__all__ = (
+    "ButtonsTemplate",
+    "CarouselColumn",
+    "CarouselTemplate",
+    "ConfirmTemplate",
+    "ImageCarouselColumn",
+    "ImageCarouselTemplate",
+)
+
+_MAX_TEXT_WITH_HEADER: Final[int] = 60
+_MAX_COLUMN_TEXT: Final[int] = 120
+_MAX_BUTTONS_TEXT: Final[int] = 160
+_MAX_CONFIRM_TEXT: Final[int] = 240
+_MAX_TITLE: Final[int] = 40
+_MAX_URL: Final[int] = 2000
+_MAX_COLUMN_ACTIONS: Final[int] = 3
+_MAX_CONFIRM_ACTIONS: Final[int] = 2
+_MAX_BUTTONS_ACTIONS: Final[int] = 4
+_MAX_COLUMNS: Final[int] = 10
+
+_ERR_COLUMN_ACTIONS = f"The number of actions must be less than or equal to {_MAX_COLUMN_ACTIONS}"
+_ERR_CONFIRM_ACTIONS = f"The number of actions must be less than or equal to {_MAX_CONFIRM_ACTIONS}"
+_ERR_BUTTONS_ACTIONS = f"The number of actions must be less than or equal to {_MAX_BUTTONS_ACTIONS}"
+_ERR_COLUMNS = f"The number of columns must be less than or equal to {_MAX_COLUMNS}"
+
 
 class CarouselColumn(messaging.CarouselColumn):
     """https://developers.line.biz/en/reference/messaging-api/#column-object-for-carousel."""
 
+    Config = FrozenConfig
+
     def __init__(
         self,
         text: str,
@@ -21,18 +52,27 @@ class CarouselColumn(messaging.CarouselColumn):
         thumbnail_image_url: str | None = None,
         image_background_color: str | None = None,
     ) -> None:
-        if (title or thumbnail_image_url) and len(text) > 60:
-            raise ValueError("The length of text must be less than or equal to 60")
-        if len(text) > 120:
-            raise ValueError("The length of text must be less than or equal to 120")
-        if len(actions) > 3:
-            raise ValueError("The number of actions must be less than or equal to 3")
-        if len(title or "") > 40:
-            raise ValueError("The length of title must be less than or equal to 40")
-        if len(thumbnail_image_url or "") > 2000:
-            raise ValueError("The length of thumbnailImageUrl must be less than or equal to 2000")
-
-        super().__init__(
+        actions = tuple(actions)
+        check_types(
+            ("text", text, str),
+            ("title", title, (str, NoneType)),
+            ("defaultAction", default_action, (messaging.Action, NoneType)),
+            ("thumbnailImageUrl", thumbnail_image_url, (str, NoneType)),
+            ("imageBackgroundColor", image_background_color, (str, NoneType)),
+        )
+        check_item_types("actions", actions, messaging.Action)
+        if __debug__:
+            text_limit = _MAX_TEXT_WITH_HEADER if title or thumbnail_image_url else _MAX_COLUMN_TEXT
+            check_lengths(
+                ("text", text, text_limit),
+                ("title", title, _MAX_TITLE),
+                ("thumbnailImageUrl", thumbnail_image_url, _MAX_URL),
+            )
+            if len(actions) > _MAX_COLUMN_ACTIONS:
+                raise ValueError(_ERR_COLUMN_ACTIONS)
+
+        init_unvalidated(
+            self,
             text=text,
             actions=actions,
             title=title,
@@ -45,6 +85,8 @@ class CarouselColumn(messaging.CarouselColumn):
 class CarouselTemplate(messaging.CarouselTemplate):
     """https://developers.line.biz/en/reference/messaging-api/#carousel."""
 
+    Config = FrozenConfig
+
     def __init__(
         self,
         columns: Sequence[CarouselColumn],
@@ -52,27 +94,39 @@ class CarouselTemplate(messaging.CarouselTemplate):
         image_aspect_raio: Literal["rectangle", "square"] = "rectangle",
         image_size: Literal["cover", "contain"] = "cover",
     ) -> None:
-        if len(columns) > 10:
-            raise ValueError("The number of columns must be less than or equal to 10")
-
-        super().__init__(columns=columns, imageAspectRatio=image_aspect_raio, imageSize=image_size)
+        columns = tuple(columns)
+        check_types(("imageAspectRatio", image_aspect_raio, str), ("imageSize", image_size, str))
+        check_item_types("columns", columns, messaging.CarouselColumn)
+        if __debug__ and len(columns) > _MAX_COLUMNS:
+            raise ValueError(_ERR_COLUMNS)
+
+        init_unvalidated(
+            self, columns=columns, imageAspectRatio=image_aspect_raio, imageSize=image_size
+        )
 
 
 class ConfirmTemplate(messaging.ConfirmTemplate):
     """https://developers.line.biz/en/reference/messaging-api/#confirm."""
 
+    Config = FrozenConfig
+
     def __init__(self, text: str, actions: Sequence[messaging.Action]) -> None:
-        if len(text) > 240:
-            raise ValueError("The length of text must be less than or equal to 240")
-        if len(actions) > 2:
-            raise ValueError("The number of actions must be less than or equal to 2")
+        actions = tuple(actions)
+        check_types(("text", text, str))
+        check_item_types("actions", actions, messaging.Action)
+        if __debug__:
+            check_lengths(("text", text, _MAX_CONFIRM_TEXT))
+            if len(actions) > _MAX_CONFIRM_ACTIONS:
+                raise ValueError(_ERR_CONFIRM_ACTIONS)
 
-        super().__init__(text=text, actions=actions)
+        init_unvalidated(self, text=text, actions=actions)
 
 
 class ButtonsTemplate(messaging.ButtonsTemplate):
     """https://developers.line.biz/en/reference/messaging-api/#buttons."""
 
+    Config = FrozenConfig
+
     def __init__(
         self,
         text: str,
@@ -85,18 +139,31 @@ class ButtonsTemplate(messaging.ButtonsTemplate):
         image_background_color: str = "#FFFFFF",
         default_action: messaging.Action | None = None,
     ) -> None:
-        if len(actions) > 4:
-            raise ValueError("The number of actions must be less than or equal to 4")
-        if (title or thumbnail_image_url) and len(text) > 60:
-            raise ValueError("The length of text must be less than or equal to 60")
-        if len(text) > 160:
-            raise ValueError("The length of text must be less than or equal to 160")
-        if len(title or "") > 40:
-            raise ValueError("The length of title must be less than or equal to 40")
-        if len(thumbnail_image_url or "") > 2000:
-            raise ValueError("The length of thumbnailImageUrl must be less than or equal to 2000")
-
-        super().__init__(
+        actions = tuple(actions)
+        check_types(
+            ("text", text, str),
+            ("title", title, (str, NoneType)),
+            ("thumbnailImageUrl", thumbnail_image_url, (str, NoneType)),
+            ("imageAspectRatio", image_aspect_raio, str),
+            ("imageSize", image_size, str),
+            ("imageBackgroundColor", image_background_color, str),
+            ("defaultAction", default_action, (messaging.Action, NoneType)),
+        )
+        check_item_types("actions", actions, messaging.Action)
+        if __debug__:
+            if len(actions) > _MAX_BUTTONS_ACTIONS:
+                raise ValueError(_ERR_BUTTONS_ACTIONS)
+            text_limit = (
+                _MAX_TEXT_WITH_HEADER if title or thumbnail_image_url else _MAX_BUTTONS_TEXT
+            )
+            check_lengths(
+                ("text", text, text_limit),
+                ("title", title, _MAX_TITLE),
+                ("thumbnailImageUrl", thumbnail_image_url, _MAX_URL),
+            )
+
+        init_unvalidated(
+            self,
             text=text,
             actions=actions,
             thumbnailImageUrl=thumbnail_image_url,
@@ -109,16 +176,23 @@ class ButtonsTemplate(messaging.ButtonsTemplate):
 
 
 class ImageCarouselColumn(messaging.ImageCarouselColumn):
+    Config = FrozenConfig
+
     def __init__(self, image_url: str, action: messaging.Action) -> None:
-        if len(image_url) > 2000:
-            raise ValueError("The length of image_url must be less than or equal to 2000")
+        check_types(("imageUrl", image_url, str), ("action", action, messaging.Action))
+        if __debug__:
+            check_lengths(("imageUrl", image_url, _MAX_URL))
 
-        super().__init__(imageUrl=image_url, action=action)
+        init_unvalidated(self, imageUrl=image_url, action=action)
 
 
 class ImageCarouselTemplate(messaging.ImageCarouselTemplate):
+    Config = FrozenConfig
+
     def __init__(self, columns: Sequence[ImageCarouselColumn]) -> None:
-        if len(columns) > 10:
-            raise ValueError("The number of columns must be less than or equal to 10")
+        columns = tuple(columns)
+        check_item_types("columns", columns, messaging.ImageCarouselColumn)
+        if __debug__ and len(columns) > _MAX_COLUMNS:
+            raise ValueError(_ERR_COLUMNS)
 
-        super().__init__(columns=columns)
+        init_unvalidated(self, columns=columns)
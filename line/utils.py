@@ -3,7 +3,27 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
+
+
+def iter_indexes(s: str, ch: str) -> Iterator[int]:
+    """Lazily yield the indexes of a character in a string.
+
+    Args:
+        s: The string to search in.
+        ch: The character to search for.
+
+    Yields:
+        Each index of the character in the string, in order. Nothing is yielded if ``ch`` is
+        not a single character.
+    """
+    if len(ch) != 1:
+        return
+
+    index = s.find(ch)
+    while index != -1:
+        yield index
+        index = s.find(ch, index + 1)
 
 
 def find_indexes(s: str, ch: str) -> Sequence[int]:
@@ -16,4 +36,4 @@ def find_indexes(s: str, ch: str) -> Sequence[int]:
     Returns:
         A list of all indexes of the character in the string.
     """
-    return [i for i, letter in enumerate(s) if letter == ch]
+    return list(iter_indexes(s, ch))